@@ -1,26 +1,60 @@
 # Core business logic for LAN Game Installer (no UI dependencies).
 #
-# Provides the base directory constant and config-file locator used by
-# every other core module (data, downloader, installer, settings).
+# Provides the base directory constant, config-file locator and YAML
+# loader/dumper used by every other core module (data, downloader, installer,
+# settings).
 
+import os
 import sys
 from pathlib import Path
 
+try:
+    # libyaml-backed loader/dumper; an order of magnitude faster than pure Python.
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 # Base path – works for both a .py script and a PyInstaller --onefile bundle.
 if getattr(sys, "frozen", False):
     BASE_DIR = Path(sys.executable).parent
 else:
     BASE_DIR = Path(__file__).parent.parent
 
+# Resolved once: resolve() walks symlinks with several lstat calls.
+EXE_DIR = Path(sys.executable).resolve().parent
+
+# Config directories in search order.
+CONFIG_DIRS: tuple[Path, ...] = (
+    Path.cwd() / "config",
+    EXE_DIR / "config",
+    Path(__file__).parent.parent / "config",
+)
+
+# Per-user cache directory for data that is expensive to recompute.
+CACHE_DIR = (
+    Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache")
+    / "LANGameInstaller"
+)
+
 
 def locate_yaml(file_name: str) -> Path | None:
     """Search standard config directories for *file_name*; return the first match."""
-    candidates = [
-        Path.cwd() / "config" / file_name,
-        Path(sys.executable).resolve().parent / "config" / file_name,
-        Path(__file__).parent.parent / "config" / file_name,
-    ]
-    for p in candidates:
+    for d in CONFIG_DIRS:
+        p = d / file_name
         if p.exists():
             return p
     return None
+
+
+def game_base_dir(game: dict) -> Path:
+    """Return the absolute base directory for *game*.
+
+    Uses the path cached under ``"_base"`` by load_games() when present.
+    """
+    base = game.get("_base")
+    if base is None:
+        bp = game.get("base_path", "")
+        base = (BASE_DIR / bp) if bp else BASE_DIR
+    return base
@@ -3,61 +3,161 @@
 # Reads games.yaml and filter.yaml to produce the game list shown in the UI.
 # Also provides helpers for resolving installer paths and computing folder sizes.
 
+import json
+import os
 from pathlib import Path
 
 import yaml
 
-from . import BASE_DIR, locate_yaml
+from . import BASE_DIR, CACHE_DIR, YamlLoader, game_base_dir, locate_yaml
 from . import settings
 
 
+# Parsed, filtered game list from the last run, keyed by the inputs below.
+_GAMES_CACHE = CACHE_DIR / "games.json"
+
+
 def load_games() -> list[dict]:
-    """Load and optionally filter the game list from games.yaml."""
+    """Load and optionally filter the game list from games.yaml.
+
+    The result is cached on disk and reused while games.yaml, filter.yaml,
+    the active filter and BASE_DIR are unchanged.
+    """
     games_path = locate_yaml("games.yaml")
     if games_path is None:
         return []
-    with open(games_path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    filter_path = locate_yaml("filter.yaml") if settings.games_filter else None
+    key = repr((_stat_key(games_path), _stat_key(filter_path),
+                settings.games_filter, str(BASE_DIR)))
+
+    games = _read_games_cache(key)
+    if games is None:
+        games = _parse_games(games_path, filter_path)
+        _write_games_cache(key, games)
+    return games
+
+
+def _parse_games(games_path: Path, filter_path: Path | None) -> list[dict]:
+    with open(games_path, "rb") as fh:
+        data = yaml.load(fh, Loader=YamlLoader)
     games = data.get("games", [])
 
-    filter_path = locate_yaml("filter.yaml")
-    if filter_path and settings.games_filter:
-        with open(filter_path, "r", encoding="utf-8") as fh:
-            filter_data = yaml.safe_load(fh) or {}
-        filters = filter_data.get("filters") or []
+    allowed: set[str] = set()
+    if filter_path:
+        filters = _read_filters(filter_path)
         active = next((f for f in filters if f.get("name") == settings.games_filter), None)
         if active:
             allowed = {str(n) for n in (active.get("games") or [])}
-            if allowed:
-                games = [g for g in games if g.get("name") in allowed]
 
+    # One pass filters and resolves each base path once, rather than on
+    # every UI query.
+    kept: list[dict] = []
+    for g in games:
+        if allowed and g.get("name") not in allowed:
+            continue
+        _resolve_base(g)
+        kept.append(g)
+    return kept
+
+
+def _resolve_base(game: dict) -> None:
+    bp = game.get("base_path", "")
+    game["_base"] = (BASE_DIR / bp) if bp else BASE_DIR
+
+
+def _stat_key(path: Path | None) -> tuple | None:
+    if path is None:
+        return None
+    st = os.stat(path)
+    return (str(path), st.st_size, st.st_mtime_ns)
+
+
+def _read_games_cache(key: str) -> list[dict] | None:
+    # JSON rather than pickle: the elevated process reads this file, and any
+    # unelevated process of the same user can write it.
+    try:
+        with open(_GAMES_CACHE, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if cached["key"] != key:
+            return None
+        games = cached["games"]
+        for g in games:
+            _resolve_base(g)
+    except Exception:  # missing, truncated or written by another version
+        return None
     return games
 
 
+def _write_games_cache(key: str, games: list[dict]) -> None:
+    plain = [{k: v for k, v in g.items() if k != "_base"} for g in games]
+    try:
+        encoded = json.dumps({"key": key, "games": plain})
+    except (TypeError, ValueError):  # e.g. a YAML date: not JSON-safe
+        return
+    # JSON turns non-string keys into strings; only cache what reads back
+    # exactly, so a cached load never differs from a fresh parse.
+    if json.loads(encoded)["games"] != plain:
+        return
+    tmp = _GAMES_CACHE.with_name(_GAMES_CACHE.name + ".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(encoded)
+        os.replace(tmp, _GAMES_CACHE)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
 def load_filter_names() -> list[str]:
     """Return the list of filter names from filter.yaml."""
     filter_path = locate_yaml("filter.yaml")
     if filter_path is None:
         return []
     try:
-        with open(filter_path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
-        return [f["name"] for f in (data.get("filters") or []) if "name" in f]
+        return [f["name"] for f in _read_filters(filter_path) if "name" in f]
     except Exception:
         return []
 
 
+# Last parse of filter.yaml, keyed by its stat; the settings panel asks for
+# the filter names every time it opens.
+_filters_memo: tuple[tuple | None, list[dict]] = (None, [])
+
+
+def _read_filters(filter_path: Path) -> list[dict]:
+    """Return the ``filters`` list from *filter_path*, reparsed only on change."""
+    global _filters_memo
+    key = _stat_key(filter_path)
+    if _filters_memo[0] != key:
+        with open(filter_path, "rb") as fh:
+            data = yaml.load(fh, Loader=YamlLoader) or {}
+        _filters_memo = (key, data.get("filters") or [])
+    return _filters_memo[1]
+
+
 def get_installer_folder(game: dict) -> Path:
     """Return the absolute path to the installer directory for *game*."""
-    bp = game.get("base_path", "")
-    return (BASE_DIR / bp) if bp else BASE_DIR
+    return game_base_dir(game)
+
+
+# Folder totals keyed by (path, mtime_ns of the folder itself).  The top-level
+# mtime only catches direct children changing, so anything that rewrites files
+# deeper down (downloads, installs) must call clear_size_cache().
+_SIZE_CACHE: dict[tuple[str, int], int] = {}
 
 
 def folder_size_str(path: Path) -> str:
     """Return a human-readable size string for *path*, or '\u2014' if absent/empty."""
-    if not path.exists():
+    try:
+        key = (str(path), os.stat(path).st_mtime_ns)
+        total = _SIZE_CACHE.get(key)
+        if total is None:
+            total = _SIZE_CACHE[key] = _walk_size(path)
+    except (FileNotFoundError, NotADirectoryError):
         return "\u2014"
-    total = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
     if total == 0:
         return "\u2014"
     for unit in ("B", "KB", "MB", "GB"):
@@ -67,14 +167,41 @@ def folder_size_str(path: Path) -> str:
     return f"{total:.1f} TB"
 
 
+def clear_size_cache() -> None:
+    """Forget all cached folder sizes."""
+    _SIZE_CACHE.clear()
+
+
+def _walk_size(path: str | os.PathLike) -> int:
+    """Sum file sizes under *path* using the type info cached on each DirEntry.
+
+    Folders that cannot be read are skipped, as Path.rglob() did.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with it:
+            for entry in it:
+                # Files vastly outnumber folders in installer trees: test them first.
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return total
+
+
 def missing_installer_files(games: list[dict]) -> list[str]:
     """Return names of games whose installer file doesn't exist locally."""
     missing: list[str] = []
     for game in games:
-        bp = game.get("base_path", "")
-        base = (BASE_DIR / bp) if bp else BASE_DIR
         installer_type = game.get("installer_type", "msi")
         rel = game.get("install_exe" if installer_type == "inno_setup" else "install_msi", "")
-        if rel and not (base / rel).exists():
+        if not rel:
+            continue  # no installer listed: nothing to check, no path to build
+        if not (game_base_dir(game) / rel).exists():
             missing.append(game["name"])
     return missing
@@ -8,7 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
+import json
+import mmap
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -17,7 +22,7 @@ import numpy as np
 from aiohttp import ClientSession, ClientTimeout
 from yarl import URL
 
-from . import BASE_DIR
+from . import game_base_dir, hash_cache
 
 # ── OneDrive API constants ─────────────────────────────────────────────────────
 API_ENTRYPOINT = URL("https://api.onedrive.com/v1.0/drives/")
@@ -47,6 +52,21 @@ _qxh_high_shift = (8 - _qxh_bit_off) % 8
 _qxh_has_high = _qxh_bit_off > 0
 _QXH_BLOCK_SIZE = (64 * 1024 * 1024 // _QXH_CYCLE) * _QXH_CYCLE
 
+# numpy releases the GIL while folding, so hashing scales across cores once
+# the mmap path removed the per-chunk Python loop.
+_HASH_WORKERS = os.cpu_count() or 4
+
+# Files fetched at once per game; overlaps per-request latency for the many
+# small files a game folder tends to hold without flooding the connection.
+_DOWNLOAD_CONCURRENCY = 4
+
+# Folder listing requests in flight at once while enumerating a game; wide
+# trees otherwise fire one per subfolder and invite OneDrive throttling.
+_LISTING_CONCURRENCY = 8
+
+# Sidecar recording the remote content tag each local file was last synced at.
+_VALIDATORS_FILE = ".etags.json"
+
 StatusCallback = Callable[[str], None]
 
 
@@ -78,6 +98,7 @@ class _FileEntry:
     local_path: Path
     size: int
     expected_hash: str | None
+    etag: str | None = None
 
 
 # ── OneDrive helpers ───────────────────────────────────────────────────────────
@@ -119,48 +140,62 @@ async def _get_badger_token(session: ClientSession) -> None:
 
 
 async def _navigate_to_subfolder(
-    session: ClientSession, api_url: URL, parts: list[str],
+    session: ClientSession,
+    api_url: URL,
+    parts: list[str],
+    subfolders: dict[str, dict[str, URL]],
 ) -> URL:
-    """Walk the OneDrive folder tree to reach the target subfolder."""
+    """Walk the OneDrive folder tree to reach the target subfolder.
+
+    *subfolders* caches each listed folder's ``{name: api_url}`` children,
+    so games sharing parent folders list each parent only once.
+    """
     current = api_url
     base = _drive_base(api_url)
     for part in parts:
-        found = False
-        page: URL | None = current / "children"
-        while page:
-            async with session.get(page, raise_for_status=True) as resp:
-                data = await resp.json()
-            for item in data.get("value", []):
-                if "folder" in item and item["name"] == part:
-                    drive_id = item["parentReference"]["driveId"]
-                    current = base / drive_id / "items" / item["id"]
-                    found = True
-                    break
-            if found:
-                break
-            nxt = data.get("@odata.nextLink")
-            page = URL(nxt) if nxt else None
-        if not found:
+        children = subfolders.get(str(current))
+        if children is None:
+            children = {}
+            page: URL | None = current / "children"
+            while page:
+                async with session.get(page, raise_for_status=True) as resp:
+                    data = await resp.json()
+                for item in data.get("value", []):
+                    if "folder" in item:
+                        drive_id = item["parentReference"]["driveId"]
+                        children[item["name"]] = base / drive_id / "items" / item["id"]
+                nxt = data.get("@odata.nextLink")
+                page = URL(nxt) if nxt else None
+            subfolders[str(current)] = children
+        if part not in children:
             raise FileNotFoundError(f"Subfolder not found in OneDrive: {part}")
+        current = children[part]
     return current
 
 
 async def _collect_files(
     session: ClientSession, api_url: URL, local_dir: Path,
+    slots: asyncio.Semaphore,
 ) -> list[_FileEntry]:
-    """Recursively enumerate every file under *api_url*."""
+    """Recursively enumerate every file under *api_url*.
+
+    Subfolders are listed concurrently, so a deep tree costs roughly one
+    round-trip per level rather than one per folder; *slots* bounds the
+    listing requests in flight.
+    """
     files: list[_FileEntry] = []
+    subfolders = []
     base = _drive_base(api_url)
     page: URL | None = api_url / "children"
     while page:
-        async with session.get(page, raise_for_status=True) as resp:
+        async with slots, session.get(page, raise_for_status=True) as resp:
             data = await resp.json()
         for item in data.get("value", []):
             path = local_dir / item["name"]
             if "folder" in item:
                 drive_id = item["parentReference"]["driveId"]
                 child = base / drive_id / "items" / item["id"]
-                files.extend(await _collect_files(session, child, path))
+                subfolders.append((child, path))
             else:
                 files.append(_FileEntry(
                     download_url=URL(item["@content.downloadUrl"]),
@@ -169,56 +204,153 @@ async def _collect_files(
                     expected_hash=(
                         item.get("file", {}).get("hashes", {}).get("quickXorHash")
                     ),
+                    etag=item.get("cTag") or item.get("eTag"),
                 ))
         nxt = data.get("@odata.nextLink")
         page = URL(nxt) if nxt else None
+    for sub in await _gather_or_cancel(
+        _collect_files(session, child, path, slots) for child, path in subfolders
+    ):
+        files.extend(sub)
     return files
 
 
+async def _gather_or_cancel(coros) -> list:
+    """Run *coros* concurrently; on the first failure cancel the rest.
+
+    The session's event loop outlives each game, so tasks left running after
+    a failure would otherwise resume during the next game's download.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _is_current(
+    entry: _FileEntry, validators: dict[str, list], key: str,
+) -> bool:
+    """Return True when the local copy of *entry* already matches the remote.
+
+    *validators* maps *key* to the ``[etag, size, mtime_ns]`` recorded the
+    last time the file was synced; a match skips hashing altogether.
+    """
+    try:
+        st = entry.local_path.stat()
+    except FileNotFoundError:
+        return False
+    if st.st_size != entry.size:
+        return False
+    if entry.etag and validators.get(key) == [entry.etag, st.st_size, st.st_mtime_ns]:
+        return True
+    if entry.expected_hash is None:
+        return False
+    local_hash = hash_cache.get(entry.local_path, st)
+    if local_hash is None:
+        loop = asyncio.get_running_loop()
+        local_hash = await loop.run_in_executor(
+            _hash_pool(), quickxorhash_file, entry.local_path,
+        )
+        hash_cache.put(entry.local_path, st, local_hash)
+    if local_hash != entry.expected_hash:
+        return False
+    _remember_validator(validators, key, entry, st)
+    return True
+
+
 async def _download_single(
     session: ClientSession,
     entry: _FileEntry,
+    validators: dict[str, list],
+    key: str,
     on_chunk: Callable[[int], None] | None = None,
-) -> bool:
-    """Download one file.  Returns *False* when the local copy is already current."""
-    if entry.local_path.exists() and entry.expected_hash is not None:
-        if entry.local_path.stat().st_size == entry.size:
-            loop = asyncio.get_running_loop()
-            local_hash = await loop.run_in_executor(
-                None, quickxorhash_file, entry.local_path,
-            )
-            if local_hash == entry.expected_hash:
-                return False
-    entry.local_path.parent.mkdir(parents=True, exist_ok=True)
-    async with session.get(entry.download_url, raise_for_status=True) as resp:
-        with entry.local_path.open("wb") as fh:
-            async for chunk in resp.content.iter_chunked(65536):
-                fh.write(chunk)
-                if on_chunk:
-                    on_chunk(len(chunk))
-    return True
+) -> None:
+    """Download one file, atomically replacing any local copy.
+
+    Data goes to a ``.part`` sibling that is renamed over the target once
+    complete, so readers (e.g. load_games during a config sync) never see a
+    half-written file and an interrupted download leaves the old copy intact.
+    The destination folder must already exist.
+    """
+    tmp = entry.local_path.with_name(entry.local_path.name + ".part")
+    try:
+        async with session.get(entry.download_url, raise_for_status=True) as resp:
+            with tmp.open("wb") as fh:
+                if entry.size > 0:
+                    fh.truncate(entry.size)  # preallocate: no extending writes
+                async for chunk in resp.content.iter_chunked(65536):
+                    fh.write(chunk)
+                    if on_chunk:
+                        on_chunk(len(chunk))
+                fh.truncate()
+        os.replace(tmp, entry.local_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _remember_validator(validators, key, entry)
+
+
+@functools.cache
+def _hash_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=_HASH_WORKERS, thread_name_prefix="quickxorhash",
+    )
+
+
+# ── Sync validators ────────────────────────────────────────────────────────────
+
+
+def _load_validators(target_dir: Path) -> dict[str, list]:
+    try:
+        with open(target_dir / _VALIDATORS_FILE, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_validators(target_dir: Path, validators: dict[str, list]) -> None:
+    try:
+        with open(target_dir / _VALIDATORS_FILE, "w", encoding="utf-8") as fh:
+            json.dump(validators, fh)
+    except OSError:
+        pass
+
+
+def _remember_validator(
+    validators: dict[str, list],
+    key: str,
+    entry: _FileEntry,
+    st: os.stat_result | None = None,
+) -> None:
+    """Record *entry*'s etag against its local size and mtime.
+
+    Pass *st* when the caller already holds a current stat of the file.
+    """
+    if not entry.etag:
+        validators.pop(key, None)
+        return
+    if st is None:
+        st = entry.local_path.stat()
+    validators[key] = [entry.etag, st.st_size, st.st_mtime_ns]
 
 
 # ── QuickXorHash ───────────────────────────────────────────────────────────────
 
 
 def quickxorhash_file(path: Path) -> str:
-    xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
-    total_length = 0
     with open(path, "rb") as fh:
-        while chunk := fh.read(_QXH_BLOCK_SIZE):
-            data = np.frombuffer(chunk, dtype=np.uint8)
-            total_length += len(data)
-            remainder = len(data) % _QXH_CYCLE
-            if remainder:
-                padded = np.zeros(
-                    len(data) + (_QXH_CYCLE - remainder), dtype=np.uint8,
-                )
-                padded[: len(data)] = data
-                data = padded
-            xor_accum ^= np.bitwise_xor.reduce(
-                data.reshape(-1, _QXH_CYCLE), axis=0,
-            )
+        total_length = os.fstat(fh.fileno()).st_size
+        if total_length:
+            # Map the file so numpy folds the page cache in place, no read copies.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                xor_accum = _qxh_fold(mm, total_length)
+        else:
+            xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
     state = np.zeros(20, dtype=np.uint8)
     low_vals = (
         (xor_accum.astype(np.uint16) << _qxh_low_shift) & 0xFF
@@ -235,6 +367,19 @@ def quickxorhash_file(path: Path) -> str:
     return base64.b64encode(bytes(state)).decode()
 
 
+def _qxh_fold(buf: mmap.mmap, size: int) -> np.ndarray:
+    """XOR every 160-byte row of *buf* together, zero-padding the tail."""
+    xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    full = size - size % _QXH_CYCLE
+    for off in range(0, full, _QXH_BLOCK_SIZE):
+        block = data[off:min(off + _QXH_BLOCK_SIZE, full)]
+        xor_accum ^= np.bitwise_xor.reduce(block.reshape(-1, _QXH_CYCLE), axis=0)
+    if full < size:
+        xor_accum[: size - full] ^= data[full:]
+    return xor_accum
+
+
 # ── Formatting helpers ─────────────────────────────────────────────────────────
 
 
@@ -259,6 +404,60 @@ def _fmt_eta(seconds: float) -> str:
 # ── Public API ─────────────────────────────────────────────────────────────────
 
 
+class DownloadSession:
+    """Reusable download context for one OneDrive *download_url*.
+
+    Keeps a single event loop and HTTP session alive across calls so that
+    consecutive downloads share pooled keep-alive connections, the resolved
+    share link, and the Badger token instead of paying for them per game.
+    """
+
+    def __init__(self, download_url: str) -> None:
+        self._download_url = download_url
+        self._loop = asyncio.new_event_loop()
+        self._session: ClientSession | None = None
+        self._resolved: dict[str, URL] = {}
+        self._subfolders: dict[str, dict[str, URL]] = {}
+
+    def __enter__(self) -> DownloadSession:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def download_game(
+        self, game: dict, status_callback: StatusCallback | None = None,
+    ) -> list[str]:
+        """Download files for *game*; see the module-level download_game()."""
+        if self._session is None:
+            self._session = self._loop.run_until_complete(self._open_session())
+        return self._loop.run_until_complete(_download_game(
+            self._session, self._download_url, game, status_callback,
+            self._resolved, self._subfolders,
+        ))
+
+    def close(self) -> None:
+        """Close the HTTP session and its event loop."""
+        if self._session is not None:
+            self._loop.run_until_complete(self._session.close())
+            self._session = None
+        # Cancel anything still pending so the loop closes without
+        # destroying live tasks.
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
+
+    @staticmethod
+    async def _open_session() -> ClientSession:
+        return ClientSession(
+            headers=DEFAULT_HEADERS, raise_for_status=False, timeout=TIMEOUTS,
+        )
+
+
 def download_game(
     download_url: str,
     game: dict,
@@ -269,96 +468,132 @@ def download_game(
     Only the subfolder matching ``game["base_path"]`` is downloaded.
     Returns a list of error messages (empty on success).
     """
-    return asyncio.run(_download_game(download_url, game, status_callback))
+    with DownloadSession(download_url) as downloads:
+        return downloads.download_game(game, status_callback)
 
 
 async def _download_game(
+    session: ClientSession,
     download_url: str,
     game: dict,
     status_cb: StatusCallback | None,
+    resolved: dict[str, URL],
+    subfolders: dict[str, dict[str, URL]],
 ) -> list[str]:
     errors: list[str] = []
     base_path = game.get("base_path", "")
-    target_dir = BASE_DIR / base_path if base_path else BASE_DIR
+    target_dir = game_base_dir(game)
 
     def notify(msg: str) -> None:
         if status_cb:
             status_cb(msg)
 
     try:
-        async with ClientSession(
-            headers=DEFAULT_HEADERS, raise_for_status=False, timeout=TIMEOUTS,
-        ) as session:
-            url = URL(download_url)
-            if _is_share_link(url):
-                notify("Resolving link\u2026")
-                async with session.get(url, allow_redirects=True) as resp:
-                    url = resp.url
-
-            access = _AccessDetails.from_url(url)
-            if access.redeem:
-                await _get_badger_token(session)
-
-            api_url = _create_api_url(access)
-
-            # Confirm root is a folder
-            async with session.get(api_url, raise_for_status=True) as resp:
-                root = await resp.json()
-            if "folder" not in root:
-                errors.append("Download URL does not point to a folder")
-                return errors
-
-            # Navigate to the subfolder matching base_path.
-            if base_path:
-                parts = [p for p in base_path.replace("\\", "/").split("/") if p]
-                root_name = root.get("name", "")
-                if parts and parts[0] == root_name:
-                    parts = parts[1:]
-                if parts:
-                    api_url = await _navigate_to_subfolder(session, api_url, parts)
-
-            # Enumerate files
-            files = await _collect_files(session, api_url, target_dir)
-            if not files:
-                notify("Up to date")
-                return errors
-
-            total_files = len(files)
-            total_bytes = sum(f.size for f in files)
-            bytes_done = 0
-            bytes_xferred = 0
-            files_done = 0
-            t0 = time.monotonic()
-            last_notify: list[float] = [0.0]
-
-            def _notify_progress(force: bool = False) -> None:
-                now = time.monotonic()
-                if not force and now - last_notify[0] < 0.1:
-                    return
-                last_notify[0] = now
-                elapsed = now - t0
-                speed = bytes_xferred / elapsed if elapsed > 0 else 0
-                eta = (total_bytes - bytes_done) / speed if speed > 0 else 0
-                pct = int(bytes_done / total_bytes * 100) if total_bytes else 0
-                notify(
-                    f"{pct}% ({files_done}/{total_files}) "
-                    f"{_fmt_speed(speed)} ~{_fmt_eta(eta)}"
-                )
-
-            def on_chunk(n: int) -> None:
-                nonlocal bytes_done, bytes_xferred
-                bytes_done += n
-                bytes_xferred += n
-                _notify_progress()
-
-            for entry in files:
-                downloaded = await _download_single(session, entry, on_chunk=on_chunk)
-                files_done += 1
-                if not downloaded:
-                    bytes_done += entry.size
-                _notify_progress(force=True)
-
-            notify("Download complete")
+        url = resolved.get(download_url) or URL(download_url)
+        if download_url not in resolved and _is_share_link(url):
+            notify("Resolving link\u2026")
+            async with session.get(url, allow_redirects=True) as resp:
+                url = resp.url
+        resolved[download_url] = url
+
+        access = _AccessDetails.from_url(url)
+        if access.redeem:
+            # Fresh token per game: a long batch can outlive a single one.
+            await _get_badger_token(session)
+
+        api_url = _create_api_url(access)
+
+        # Confirm root is a folder
+        async with session.get(api_url, raise_for_status=True) as resp:
+            root = await resp.json()
+        if "folder" not in root:
+            errors.append("Download URL does not point to a folder")
+            return errors
+
+        # Navigate to the subfolder matching base_path.
+        if base_path:
+            parts = [p for p in base_path.replace("\\", "/").split("/") if p]
+            root_name = root.get("name", "")
+            if parts and parts[0] == root_name:
+                parts = parts[1:]
+            if parts:
+                api_url = await _navigate_to_subfolder(
+                    session, api_url, parts, subfolders)
+
+        # Enumerate files
+        files = await _collect_files(
+            session, api_url, target_dir,
+            asyncio.Semaphore(_LISTING_CONCURRENCY))
+        if not files:
+            notify("Up to date")
+            return errors
+
+        total_files = len(files)
+        total_bytes = sum(f.size for f in files)
+        bytes_done = 0
+        bytes_xferred = 0
+        files_done = 0
+        t0 = time.monotonic()
+        last_notify: list[float] = [0.0]
+
+        def _notify_progress(force: bool = False) -> None:
+            now = time.monotonic()
+            if not force and now - last_notify[0] < 0.1:
+                return
+            last_notify[0] = now
+            elapsed = now - t0
+            speed = bytes_xferred / elapsed if elapsed > 0 else 0
+            eta = (total_bytes - bytes_done) / speed if speed > 0 else 0
+            pct = int(bytes_done / total_bytes * 100) if total_bytes else 0
+            notify(
+                f"{pct}% ({files_done}/{total_files}) "
+                f"{_fmt_speed(speed)} ~{_fmt_eta(eta)}"
+            )
+
+        def on_chunk(n: int) -> None:
+            nonlocal bytes_done, bytes_xferred
+            bytes_done += n
+            bytes_xferred += n
+            _notify_progress()
+
+        validators = _load_validators(target_dir)
+        validators_before = dict(validators)
+        # Every local path starts with target_dir, so slice the prefix off
+        # rather than paying for Path.relative_to() per file.
+        prefix = len(str(target_dir).rstrip(os.sep)) + 1
+        keys = [str(e.local_path)[prefix:].replace(os.sep, "/") for e in files]
+        slots = asyncio.Semaphore(_DOWNLOAD_CONCURRENCY)
+        made_dirs: set[Path] = set()
+
+        async def _sync(entry: _FileEntry, key: str) -> None:
+            nonlocal bytes_done, files_done
+            # Each file is fetched as soon as its own check fails, so hashing
+            # large local copies overlaps with downloading the others.
+            if await _is_current(entry, validators, key):
+                bytes_done += entry.size
+            else:
+                folder = entry.local_path.parent
+                if folder not in made_dirs:  # one mkdir per folder
+                    folder.mkdir(parents=True, exist_ok=True)
+                    made_dirs.add(folder)
+                async with slots:
+                    await _download_single(
+                        session, entry, validators, key, on_chunk=on_chunk,
+                    )
+            files_done += 1
+            _notify_progress()
+
+        try:
+            # A failure cancels the remaining checks and downloads.
+            await _gather_or_cancel(
+                _sync(entry, key) for entry, key in zip(files, keys))
+            _notify_progress(force=True)
+        finally:
+            if validators != validators_before:  # no rewrite when up to date
+                _save_validators(target_dir, validators)
+            hash_cache.save()
+
+        notify("Download complete")
 
     except Exception as exc:
         errors.append(f"Download failed: {exc}")
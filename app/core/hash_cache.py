@@ -0,0 +1,65 @@
+# Persistent QuickXorHash cache.
+#
+# Maps an absolute file path to the (size, mtime_ns) it had when hashed and
+# the resulting digest, so unchanged files are never re-read across runs.
+# Stored as JSON under CACHE_DIR; a missing or corrupt file is treated as
+# an empty cache.
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from . import CACHE_DIR
+
+CACHE_FILE = CACHE_DIR / "hash_cache.json"
+
+_lock = threading.Lock()
+_entries: dict[str, list] | None = None
+_dirty = False
+
+
+def _load() -> dict[str, list]:
+    global _entries
+    if _entries is None:
+        try:
+            with open(CACHE_FILE, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        _entries = data if isinstance(data, dict) else {}
+    return _entries
+
+
+def get(path: Path, st: os.stat_result) -> str | None:
+    """Return the cached digest for *path* if *st* still matches, else None."""
+    with _lock:
+        hit = _load().get(str(path))
+    if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+        return hit[2]
+    return None
+
+
+def put(path: Path, st: os.stat_result, digest: str) -> None:
+    """Record *digest* for *path* as of the stat result *st*."""
+    global _dirty
+    with _lock:
+        _load()[str(path)] = [st.st_size, st.st_mtime_ns, digest]
+        _dirty = True
+
+
+def save() -> None:
+    """Write the cache to disk if anything changed since the last save."""
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return
+        tmp = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(_entries, fh)
+            os.replace(tmp, CACHE_FILE)
+        except OSError:
+            return
+        _dirty = False
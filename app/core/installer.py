@@ -5,10 +5,12 @@
 
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Callable
 
-from . import BASE_DIR
-from .downloader import download_game
+from . import BASE_DIR, game_base_dir
 
 StatusCallback = Callable[[str, str], None]
 
@@ -28,18 +30,60 @@ def run_installs(
     is skipped.  Returns a list of error messages (empty = all OK).
     """
     errors: list[str] = []
-
-    for game in games:
-        name = game["name"]
-
-        def _notify(msg: str, _name: str = name) -> None:
-            if status_callback:
-                status_callback(_name, msg)
-
+    # Prerequisites (redistributables etc.) shared by several games in the
+    # batch are installed once rather than once per game.
+    prereqs_done: set[tuple[str, str]] = set()
+    # (game, status) last reported by the install worker while it has work.
+    # Download progress for the next game is shown after it, so the status
+    # line never hides which game is installing or which one just failed.
+    install_status: list[tuple[str, str] | None] = [None]
+    installs_queued = 0
+    queue_lock = threading.Lock()
+
+    def _run_install(game: dict, notify: Callable[[str], None]) -> None:
+        nonlocal installs_queued
         try:
-            # ── Download phase ─────────────────────────────────────────
-            if download_url and game.get("base_path"):
-                dl_errors = download_game(download_url, game, _notify)
+            _install_game(game, install_dir, player, server_ip_parts,
+                          prereqs_done, errors, notify)
+        finally:
+            with queue_lock:
+                installs_queued -= 1
+                if not installs_queued:  # idle: stop prefixing progress
+                    install_status[0] = None
+
+    if download_url:
+        # Deferred: aiohttp is only needed once something downloads.
+        from .downloader import DownloadSession
+
+    # Installs run one at a time on a worker thread while this thread moves
+    # on to the next game's download, so network and installer time overlap.
+    # One session for the whole batch so downloads share connections.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="install") as installs, \
+            DownloadSession(download_url) if download_url else nullcontext() as downloads:
+        for game in games:
+            name = game["name"]
+
+            def _notify(msg: str, _name: str = name) -> None:
+                if not status_callback:
+                    return
+                current = install_status[0]
+                if current is None:
+                    status_callback(_name, msg)
+                else:
+                    status_callback(current[0], f"{current[1]}  \u2502  {_name}: {msg}")
+
+            def _notify_install(msg: str, _name: str = name) -> None:
+                install_status[0] = (_name, msg)
+                if status_callback:
+                    status_callback(_name, msg)
+
+            # ── Download phase ─────────────────────────────────────────────
+            if downloads and game.get("base_path"):
+                try:
+                    dl_errors = downloads.download_game(game, _notify)
+                except Exception as exc:  # noqa: BLE001
+                    dl_errors = [str(exc)]
+                    _notify(f"Error: {exc}")
                 if dl_errors:
                     errors.extend(f"{name}: {e}" for e in dl_errors)
                     continue
@@ -47,58 +91,81 @@ def run_installs(
             if download_only:
                 continue
 
-            # ── Install phase ──────────────────────────────────────────
-            _notify("Installing\u2026")
-
-            base_path = BASE_DIR / game["base_path"] if game.get("base_path") else BASE_DIR
-            target_dir = os.path.normpath(os.path.join(install_dir, game["name"]))
+            with queue_lock:
+                installs_queued += 1
+            installs.submit(_run_install, game, _notify_install)
 
-            # Prerequisites
-            for prereq in game.get("prerequisites", []):
-                prereq_path = BASE_DIR / prereq["path"]
-                args = prereq.get("args", "")
-                subprocess.run(f'"{prereq_path}" {args}'.strip(), shell=True, check=False)
+    return errors
 
-            installer_type = game.get("installer_type", "msi")
 
-            if installer_type == "inno_setup":
-                exe_rel = game.get("install_exe", "")
-                if not exe_rel:
-                    continue
-                exe_path = base_path / exe_rel
-                cmd = [
-                    f'"{exe_path}"',
-                    "/SILENT",
-                    "/SUPPRESSMSGBOXES",
-                    "/NORESTART",
-                    f'/DIR="{target_dir}"',
-                ]
-                if player and game.get("supports_player_name", False):
-                    cmd.append(f'/PLAYERNAME="{player}"')
-                subprocess.run(" ".join(cmd), shell=True, check=True)
-
-            else:
-                msi_rel = game.get("install_msi", "")
-                if not msi_rel:
-                    continue
-                msi_path = base_path / msi_rel
-                install_dir_msi = target_dir.rstrip("\\") + "\\"
-                cmd = ["msiexec", "/i", f'"{msi_path}"', f'INSTALLDIR="{install_dir_msi}"']
-                if player and game.get("supports_player_name", False):
-                    cmd.append(f'PLAYERNAME="{player}"')
-                if server_ip_parts and game.get("requires_server_ip", False):
-                    for i, octet in enumerate(server_ip_parts, start=1):
-                        cmd.append(f'SERVERADDRESS{i}="{octet}"')
-                cmd.append("/qb")
-                subprocess.run(" ".join(cmd), shell=True, check=True)
-
-            _notify("Complete")
-
-        except subprocess.CalledProcessError as exc:
-            errors.append(f'{name}: installer exited with code {exc.returncode}')
-            _notify(f"Error (exit {exc.returncode})")
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f'{name}: {exc}')
-            _notify(f"Error: {exc}")
-
-    return errors
+def _install_game(
+    game: dict,
+    install_dir: str,
+    player: str,
+    server_ip_parts: list[str] | None,
+    prereqs_done: set[tuple[str, str]],
+    errors: list[str],
+    notify: Callable[[str], None],
+) -> None:
+    """Run *game*'s prerequisites and installer, appending any failure to *errors*."""
+    name = game["name"]
+    try:
+        notify("Installing\u2026")
+
+        base_path = game_base_dir(game)
+        target_dir = os.path.normpath(os.path.join(install_dir, game["name"]))
+
+        # Prerequisites
+        for prereq in game.get("prerequisites", []):
+            prereq_path = BASE_DIR / prereq["path"]
+            args = prereq.get("args", "")
+            if (str(prereq_path), args) in prereqs_done:
+                continue
+            prereqs_done.add((str(prereq_path), args))
+            # Via the shell: a prerequisite may be any file type with
+            # an association (.msi, .bat, ...), not just an .exe.
+            subprocess.run(f'"{prereq_path}" {args}'.strip(), shell=True, check=False)
+
+        installer_type = game.get("installer_type", "msi")
+
+        if installer_type == "inno_setup":
+            exe_rel = game.get("install_exe", "")
+            if not exe_rel:
+                return
+            exe_path = base_path / exe_rel
+            cmd = [
+                f'"{exe_path}"',
+                "/SILENT",
+                "/SUPPRESSMSGBOXES",
+                "/NORESTART",
+                f'/DIR="{target_dir}"',
+            ]
+            if player and game.get("supports_player_name", False):
+                cmd.append(f'/PLAYERNAME="{player}"')
+            # Launched directly: the command line reaches CreateProcess
+            # verbatim, without a cmd.exe in between.
+            subprocess.run(" ".join(cmd), check=True)
+
+        else:
+            msi_rel = game.get("install_msi", "")
+            if not msi_rel:
+                return
+            msi_path = base_path / msi_rel
+            install_dir_msi = target_dir.rstrip("\\") + "\\"
+            cmd = ["msiexec", "/i", f'"{msi_path}"', f'INSTALLDIR="{install_dir_msi}"']
+            if player and game.get("supports_player_name", False):
+                cmd.append(f'PLAYERNAME="{player}"')
+            if server_ip_parts and game.get("requires_server_ip", False):
+                for i, octet in enumerate(server_ip_parts, start=1):
+                    cmd.append(f'SERVERADDRESS{i}="{octet}"')
+            cmd.append("/qb")
+            subprocess.run(" ".join(cmd), check=True)
+
+        notify("Complete")
+
+    except subprocess.CalledProcessError as exc:
+        errors.append(f'{name}: installer exited with code {exc.returncode}')
+        notify(f"Error (exit {exc.returncode})")
+    except Exception as exc:  # noqa: BLE001
+        errors.append(f'{name}: {exc}')
+        notify(f"Error: {exc}")
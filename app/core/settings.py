@@ -3,12 +3,15 @@
 # Settings are loaded once at import time.  Call save() to persist
 # one or more changes and keep the in-memory values in sync.
 
-import sys
 from pathlib import Path
 
 import yaml
 
-from . import locate_yaml
+from . import CONFIG_DIRS, YamlDumper, YamlLoader, locate_yaml
+
+# Never fold long values (URLs, filter names) across lines when writing.
+# libyaml needs an int here, so no float("inf").
+_YAML_WIDTH = 1 << 30
 
 _DEFAULTS: dict = {
     "disable_game_sync": False,
@@ -25,16 +28,13 @@ def _find_or_create_settings_path() -> Path:
     if found:
         return found
 
-    candidates = [
-        Path.cwd() / "config" / "usersettings.yaml",
-        Path(sys.executable).resolve().parent / "config" / "usersettings.yaml",
-        Path(__file__).parent.parent / "config" / "usersettings.yaml",
-    ]
+    candidates = [d / "usersettings.yaml" for d in CONFIG_DIRS]
     for p in candidates:
         try:
             p.parent.mkdir(parents=True, exist_ok=True)
             with open(p, "w", encoding="utf-8") as fh:
-                yaml.dump(_DEFAULTS, fh, allow_unicode=True, sort_keys=False)
+                yaml.dump(_DEFAULTS, fh, Dumper=YamlDumper, width=_YAML_WIDTH,
+                          allow_unicode=True, sort_keys=False)
             return p
         except OSError:
             continue
@@ -47,37 +47,52 @@ SETTINGS_PATH: Path = _find_or_create_settings_path()
 
 _data: dict = dict(_DEFAULTS)
 try:
-    with open(SETTINGS_PATH, "r", encoding="utf-8") as _fh:
-        _loaded = yaml.safe_load(_fh) or {}
+    with open(SETTINGS_PATH, "rb") as _fh:
+        _loaded = yaml.load(_fh, Loader=YamlLoader) or {}
     _data.update({k: _loaded[k] for k in _DEFAULTS if k in _loaded})
 except Exception:
     pass
 
-disable_game_sync: bool       = bool(_data["disable_game_sync"])
-disable_downloads: bool       = bool(_data["disable_downloads"])
-download_only:     bool       = bool(_data["download_only"])
-games_filter:      str        = str(_data["games_filter"] or "")
-download_url:      str | None = _data["download_url"] or None
+
+def _coerce(data: dict) -> dict:
+    """Return *data* with every setting normalised to its declared type."""
+    return {
+        "disable_game_sync": bool(data["disable_game_sync"]),
+        "disable_downloads": bool(data["disable_downloads"]),
+        "download_only":     bool(data["download_only"]),
+        "games_filter":      str(data["games_filter"] or ""),
+        "download_url":      data["download_url"] or None,
+    }
+
+
+_data = _coerce(_data)
+
+disable_game_sync: bool       = _data["disable_game_sync"]
+disable_downloads: bool       = _data["disable_downloads"]
+download_only:     bool       = _data["download_only"]
+games_filter:      str        = _data["games_filter"]
+download_url:      str | None = _data["download_url"]
+
+
+def as_dict() -> dict:
+    """Return a copy of all current settings, keyed by setting name."""
+    return dict(_data)
 
 
 def save(**kwargs) -> None:
     """Update one or more settings in memory and write to SETTINGS_PATH."""
-    global disable_game_sync, disable_downloads, download_only, games_filter, download_url
-
-    current = {
-        "disable_game_sync": disable_game_sync,
-        "disable_downloads": disable_downloads,
-        "download_only":     download_only,
-        "games_filter":      games_filter,
-        "download_url":      download_url,
-    }
-    current.update(kwargs)
-
-    disable_game_sync = bool(current["disable_game_sync"])
-    disable_downloads = bool(current["disable_downloads"])
-    download_only     = bool(current["download_only"])
-    games_filter      = str(current["games_filter"] or "")
-    download_url      = current["download_url"] or None
+    global _data, disable_game_sync, disable_downloads, download_only, games_filter, download_url
+
+    updated = _coerce({**_data, **kwargs})
+    if updated == _data:
+        return  # nothing changed: skip rewriting the file
+    _data = updated
+    disable_game_sync = _data["disable_game_sync"]
+    disable_downloads = _data["disable_downloads"]
+    download_only     = _data["download_only"]
+    games_filter      = _data["games_filter"]
+    download_url      = _data["download_url"]
 
     with open(SETTINGS_PATH, "w", encoding="utf-8") as fh:
-        yaml.dump(current, fh, allow_unicode=True, sort_keys=False)
+        yaml.dump(_data, fh, Dumper=YamlDumper, width=_YAML_WIDTH,
+                  allow_unicode=True, sort_keys=False)
@@ -2,6 +2,7 @@
 """LAN Game Installer – LAN Party Game Installer (entry point)."""
 
 import ctypes
+import subprocess
 import sys
 
 
@@ -18,21 +19,22 @@ def _elevate() -> None:
     if getattr(sys, "frozen", False):
         # PyInstaller one-file bundle: the exe IS the entry point.
         executable = sys.executable
-        params = " ".join(f'"{a}"' for a in sys.argv[1:])
+        params = subprocess.list2cmdline(sys.argv[1:])
     else:
         # Running as a plain Python script – use pythonw.exe to suppress the console.
         executable = sys.executable.replace("python.exe", "pythonw.exe")
-        params = " ".join(f'"{a}"' for a in sys.argv)
+        params = subprocess.list2cmdline(sys.argv)
 
     ctypes.windll.shell32.ShellExecuteW(None, "runas", executable, params, None, 1)
     sys.exit(0)
 
 
-from ui.app import LANInatall
-
 if __name__ == "__main__":
     if not _is_admin():
         _elevate()
 
+    # Imported only in the elevated process: pulls in Tk, PyYAML and friends.
+    from ui.app import LANInatall
+
     app = LANInatall()
     app.mainloop()
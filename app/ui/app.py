@@ -5,20 +5,24 @@
 # the install / download workflow on background threads.  It owns no
 # business logic itself — that lives in core/.
 
+import os
 import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog
 
 from .theme import C, FONT, FONT_BOLD, FONT_HEAD
 from .widgets import CyberButton, neon_box, neon_line
 from .game_list import GameList
-from .game_details import GameDetails
+from .game_details import GameDetails, reset_image_index
 from .settings_panel import SettingsPanel
 from .status_bar import StatusBar
 from core import BASE_DIR, settings
-from core.data import load_games, missing_installer_files
+from core.data import (clear_size_cache, folder_size_str,
+                       get_installer_folder, load_games,
+                       missing_installer_files)
 from core.installer import run_installs
-from core.downloader import download_game
 
 
 class LANInatall(tk.Tk):
@@ -27,20 +31,39 @@ class LANInatall(tk.Tk):
         super().__init__()
         self.title("LAN Game Installer")
         self.configure(bg=C["bg"])
-        self.state('zoomed')
 
-        self.games = load_games()
+        self.games: list[dict] = []
         self.install_type = tk.StringVar(value="game")
         self.player_name = tk.StringVar()
         self._install_btn: CyberButton | None = None
         self._installing = False
         self._config_reload_pending = False
+        self._closing = False
+        # Sync state, touched only on the UI thread.
+        self._syncing = False
+        self._sync_pending = False
+        # Shared, bounded pool for disk-bound work kicked off from the UI.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 2),
+            thread_name_prefix="lan-io",
+        )
 
         self._build_ui()
         self.install_type.trace_add(
-            "write", lambda *_: self._game_list.populate(
-                self.games, self.install_type.get()))
+            "write", lambda *_: self._game_list.set_mode(
+                self.install_type.get()))
         self.bind("<Configure>", self._on_resize)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Parse games.yaml off the UI thread so the window paints first.
+        self._game_list.set_placeholder("Loading games\u2026")
+        self._initial_load: Future | None = self._io_pool.submit(load_games)
+
+        def _loaded(fut: Future) -> None:
+            if not fut.cancelled():
+                self._post_from_pool(self._on_games_loaded, fut)
+
+        self._initial_load.add_done_callback(_loaded)
         self._sync_config()
 
     # ── UI construction ────────────────────────────────────────────────────────
@@ -100,6 +123,9 @@ class LANInatall(tk.Tk):
         # Settings overlay – must be last so it stacks on top
         self._settings_panel = SettingsPanel(self, on_save=self._on_settings_saved)
 
+        # Maximise once everything is packed: one layout pass at final size.
+        self.after(0, self.state, "zoomed")
+
     def _build_header(self) -> None:
         hdr = tk.Frame(self, bg=C["header"], padx=20, pady=10)
         hdr.pack(fill="x")
@@ -183,24 +209,64 @@ class LANInatall(tk.Tk):
     def _on_resize(self, _event) -> None:
         self._settings_panel.snap_to_edge()
 
+    def _on_close(self) -> None:
+        self._closing = True
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _post_from_pool(self, func, *args) -> None:
+        """Schedule *func* on the UI thread from an I/O pool callback.
+
+        A task already running at close still finishes after the window is
+        destroyed; its result is then dropped instead of raising in the worker.
+        """
+        if self._closing:
+            return
+        try:
+            self.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
     # ── Settings save callback ─────────────────────────────────────────────────
 
     def _on_game_selected(self, game: dict) -> None:
         """Called when a game row is clicked in the list."""
-        import threading
-        from core.data import folder_size_str, get_installer_folder
-
         self._game_details.show_game(game)
 
-        def _load_size(g=game):
-            size = folder_size_str(get_installer_folder(g))
-            self.after(0, self._game_details.update_size, size)
+        future = self._io_pool.submit(
+            folder_size_str, get_installer_folder(game))
+
+        def _apply(fut: Future, g=game) -> None:
+            if fut.cancelled() or fut.exception() is not None:
+                return
+            self._post_from_pool(self._apply_size, g, fut.result())
+
+        future.add_done_callback(_apply)
+
+    def _apply_size(self, game: dict, size: str) -> None:
+        # Drop results for a game the user has already moved away from.
+        if self._game_list.selected_game() is game:
+            self._game_details.update_size(size)
 
-        threading.Thread(target=_load_size, daemon=True).start()
+    def _on_games_loaded(self, fut: Future) -> None:
+        # A config sync or settings save may already have reloaded the list.
+        if self._initial_load is not fut:
+            return
+        self._initial_load = None
+        exc = fut.exception()
+        if exc is not None:
+            self._game_list.set_placeholder("Could not load games")
+            self._status_bar.set("\u25b6 Failed to load games list")
+            messagebox.showerror("Games List Error",
+                                 f"Failed to load games.yaml:\n\n{exc}")
+            return
+        self.games = fut.result()
+        self._game_list.populate(self.games, self.install_type.get())
 
     def _on_settings_saved(self, url_changed: bool) -> None:
         """Called by the settings panel after a successful save."""
         self._refresh_install_btn_label()
+        self._initial_load = None
         self.games = load_games()
         self._game_list.populate(self.games, self.install_type.get())
         if url_changed and settings.download_url and not settings.disable_game_sync:
@@ -271,8 +337,10 @@ class LANInatall(tk.Tk):
                 return
             server_ip_parts = parts
 
-        missing = missing_installer_files(selected)
-        if missing and not dl_url and not settings.disable_downloads:
+        # Only probe the disk when a missing installer would change the flow.
+        need_url = not dl_url and not settings.disable_downloads
+        missing = missing_installer_files(selected) if need_url else []
+        if missing:
             url = simpledialog.askstring(
                 "Download URL Required",
                 "The following game installer(s) were not found locally:\n"
@@ -306,6 +374,7 @@ class LANInatall(tk.Tk):
             download_url=download_url, status_callback=_status_cb,
             download_only=download_only,
         )
+        clear_size_cache()  # downloads rewrite files below the top level
 
         # Refresh details panel for the currently viewed game
         current = self._game_list.selected_game()
@@ -328,12 +397,33 @@ class LANInatall(tk.Tk):
     def _sync_config(self) -> None:
         if settings.disable_game_sync or not settings.download_url:
             return
+        # Only one sync at a time; a request made mid-sync (e.g. a new URL
+        # saved during the startup sync) runs again once the current one ends.
+        if self._syncing:
+            self._sync_pending = True
+            return
+        self._syncing = True
         self._status_bar.set("\u25b6 Syncing games list", animated=True)
         threading.Thread(target=self._run_config_sync, daemon=True).start()
 
     def _run_config_sync(self) -> None:
+        try:
+            self._do_config_sync()
+        finally:
+            self.after(0, self._on_config_sync_done)
+
+    def _on_config_sync_done(self) -> None:
+        self._syncing = False
+        if self._sync_pending:
+            self._sync_pending = False
+            self._sync_config()
+
+    def _do_config_sync(self) -> None:
+        # Imported on this worker thread to keep aiohttp off the startup path.
+        from core.downloader import download_game
+
         games_yaml = BASE_DIR / "config" / "games.yaml"
-        mtime_before = games_yaml.stat().st_mtime if games_yaml.exists() else None
+        mtime_before = _mtime_or_none(games_yaml)
 
         errors = download_game(
             settings.download_url, {"base_path": "config"}, None)
@@ -342,8 +432,8 @@ class LANInatall(tk.Tk):
             self.after(0, self._status_bar.set,
                        "\u25b6 Failed to connect to OneDrive")
         else:
-            mtime_after = (games_yaml.stat().st_mtime
-                           if games_yaml.exists() else None)
+            reset_image_index()  # the sync may have brought new banners
+            mtime_after = _mtime_or_none(games_yaml)
             if mtime_after != mtime_before:
                 self.after(0, self._on_config_synced)
             else:
@@ -355,6 +445,7 @@ class LANInatall(tk.Tk):
         if self._installing:
             self._config_reload_pending = True
         else:
+            self._initial_load = None
             self.games = load_games()
             self._game_list.populate(self.games, self.install_type.get())
 
@@ -364,5 +455,14 @@ class LANInatall(tk.Tk):
             self._install_btn.configure(state="disabled" if busy else "normal")
         if not busy and self._config_reload_pending:
             self._config_reload_pending = False
+            self._initial_load = None
             self.games = load_games()
             self._game_list.populate(self.games, self.install_type.get())
+
+
+def _mtime_or_none(path: Path) -> float | None:
+    """Return *path*'s mtime from a single stat, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
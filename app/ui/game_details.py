@@ -4,31 +4,53 @@
 # Content is updated via show_game() when the user clicks
 # a row in the adjacent game list.
 
-import sys
+import os
 import tkinter as tk
 from pathlib import Path
 
 import numpy as np
 from PIL import Image, ImageFilter, ImageTk
 
-from core import BASE_DIR
+from core import BASE_DIR, EXE_DIR
 from .theme import C, FONT, FONT_BOLD, FONT_HEAD, FONT_SM
 
 # ── Banner configuration ──────────────────────────────────────────────────────
 BANNER_HEIGHT = 350  # ← Adjust this value to control the banner image height (px)
 
 
+# Image search directories, in priority order.
+_IMAGE_DIRS = (
+    Path.cwd() / "config" / "images",
+    EXE_DIR / "config" / "images",
+    BASE_DIR / "config" / "images",
+)
+
+# normcase(file name) -> path string, built with one scandir per directory.
+_image_index: dict[str, str] | None = None
+
+
 def _find_game_image(name: str) -> Path | None:
     """Locate the banner image for *name* across config search paths."""
-    candidates = [
-        Path.cwd() / "config" / "images" / f"{name}.png",
-        Path(sys.executable).resolve().parent / "config" / "images" / f"{name}.png",
-        BASE_DIR / "config" / "images" / f"{name}.png",
-    ]
-    for p in candidates:
-        if p.exists():
-            return p
-    return None
+    global _image_index
+    if _image_index is None:
+        index: dict[str, str] = {}
+        for d in reversed(_IMAGE_DIRS):  # earlier directories win
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        index[os.path.normcase(entry.name)] = entry.path
+            except OSError:
+                continue
+        _image_index = index
+    # Build a Path only for the one image actually requested.
+    hit = _image_index.get(os.path.normcase(f"{name}.png"))
+    return Path(hit) if hit else None
+
+
+def reset_image_index() -> None:
+    """Forget the image index, e.g. after a config sync added images."""
+    global _image_index
+    _image_index = None
 
 
 class GameBanner(tk.Canvas):
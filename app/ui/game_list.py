@@ -2,13 +2,118 @@
 #
 # Displays all games that match the current install mode (game / server)
 # as selectable rows with a checkbox, name, and selection highlight.
+# Rows are virtualised: a small pool of row widgets, sized to the viewport,
+# is rebound to whichever games are scrolled into view.
 # Owns no business logic – just presentation and selection state.
 
+import math
 import tkinter as tk
+from itertools import compress
 
 from .theme import C, FONT, FONT_BOLD
 from .widgets import CyberScrollbar, neon_line
 
+# Row colours resolved once; paint() runs on every hover and scroll step.
+_ROW_EVEN = C["row_even"]
+_ROW_ODD = C["row_odd"]
+_ROW_HOVER = C["row_hover"]
+_CYAN = C["cyan"]
+_MAGENTA = C["magenta"]
+_BORDER = C["border"]
+
+
+class _RowView:
+    """One pooled set of row widgets, rebound to the game scrolled under it."""
+
+    __slots__ = ("owner", "idx", "hover", "var", "frame", "stripe", "cb",
+                 "num_lbl", "name_lbl", "bg_widgets", "win_id", "bg",
+                 "stripe_bg")
+
+    def __init__(self, parent: tk.Widget, owner: "GameList"):
+        self.owner = owner
+        self.idx = -1
+        self.hover = False
+        self.var = tk.BooleanVar(value=False)
+
+        self.frame = tk.Frame(parent, bg=C["row_even"], pady=6, cursor="hand2")
+        self.stripe = tk.Frame(self.frame, bg=C["border"], width=4)
+        self.stripe.pack(side="left", fill="y")
+        self.cb = tk.Checkbutton(
+            self.frame, variable=self.var,
+            bg=C["row_even"], fg=C["cyan"],
+            selectcolor=C["cb_select"], activebackground=C["row_even"],
+            activeforeground=C["cyan"], bd=0, relief="flat",
+        )
+        self.cb.pack(side="left", padx=(6, 0))
+        self.num_lbl = tk.Label(self.frame, font=FONT, bg=C["row_even"],
+                                fg=C["text_dim"], width=3, anchor="e")
+        self.num_lbl.pack(side="left")
+        self.name_lbl = tk.Label(self.frame, font=FONT, bg=C["row_even"],
+                                 fg=C["text"], anchor="w")
+        self.name_lbl.pack(side="left", padx=(8, 0), fill="x", expand=True)
+        self.bg_widgets = (self.frame, self.num_lbl, self.name_lbl)
+        self.win_id = 0
+        # Last colours applied, so repaints that change nothing skip Tk.
+        self.bg = _ROW_EVEN
+        self.stripe_bg = _BORDER
+
+        # Bound methods rather than per-row closures.
+        self.cb.configure(command=self.on_toggle)
+        for w in self.bg_widgets:
+            w.bind("<Button-1>", self.on_click)
+        for w in (*self.bg_widgets, self.cb):
+            w.bind("<Enter>", self.on_enter)
+            w.bind("<Leave>", self.on_leave)
+            w.bindtags((owner.wheel_tag,) + w.bindtags())
+        self.stripe.bindtags((owner.wheel_tag,) + self.stripe.bindtags())
+
+    def bind_game(self, idx: int, game: dict, checked: bool) -> None:
+        """Show *game* (row number *idx*) in this row."""
+        self.idx = idx
+        self.var.set(checked)
+        self.num_lbl.configure(text=f"{idx + 1:02d}")
+        self.name_lbl.configure(text=game["name"])
+
+    def paint(self, selected: bool, checked: bool) -> None:
+        """Apply background and stripe colours for the row's current state."""
+        if selected or self.hover:
+            bg = _ROW_HOVER
+        else:
+            bg = _ROW_EVEN if self.idx % 2 == 0 else _ROW_ODD
+        if bg != self.bg:
+            self.bg = bg
+            for w in self.bg_widgets:
+                w.configure(bg=bg)
+            self.cb.configure(bg=bg, activebackground=bg)
+        if checked:
+            stripe_bg = _CYAN
+        else:
+            stripe_bg = _MAGENTA if self.hover else _BORDER
+        self.set_stripe(stripe_bg)
+
+    def set_stripe(self, color: str) -> None:
+        if color != self.stripe_bg:
+            self.stripe_bg = color
+            self.stripe.configure(bg=color)
+
+    # ── Event handlers ────────────────────────────────────────────────────────
+
+    def on_toggle(self) -> None:
+        if self.idx >= 0:
+            self.owner._row_toggled(self)
+
+    def on_click(self, _event: tk.Event) -> None:
+        if self.idx >= 0:
+            self.owner.select_game(self.idx)
+
+    def on_enter(self, _event: tk.Event) -> None:
+        self.hover = True
+        self.owner._paint(self)
+
+    def on_leave(self, _event: tk.Event) -> None:
+        self.hover = False
+        self.owner._paint(self)
+
 
 class GameList(tk.Frame):
     """Scrollable, selectable game list with column headers."""
@@ -16,13 +121,23 @@ class GameList(tk.Frame):
     def __init__(self, parent: tk.Widget, on_select=None):
         super().__init__(parent, bg=C["surface"])
 
-        self.check_vars: list[tk.BooleanVar] = []
         self.visible_games: list[dict] = []
-        self._stripe_widgets: list[tk.Frame] = []
-        self._row_frames: list[tuple[tk.Frame, str]] = []
+        # One byte per visible game: 1 when its checkbox is ticked.
+        self._checked = bytearray()
+        self._games_by_type: dict[str, list[dict]] = {}
+        self._mode: str | None = None
+        # Per-mode (visible_games, checked, checked_count, selected_idx, top)
+        # saved when switching away, so flipping modes restores selections.
+        self._mode_state: dict[str, tuple[list[dict], bytearray, int, int, float]] = {}
+        self._row_pool: list[_RowView] = []
+        self._row_h = 0
+        self._first = -1
         self._check_all_var = tk.BooleanVar(value=False)
+        self._checked_count = 0
         self._on_select = on_select
         self._selected_idx = -1
+        self._pending_scroll = 0
+        self._scroll_job: str | None = None
 
         container = tk.Frame(self, bg=C["surface"])
         container.pack(fill="both", expand=True)
@@ -32,48 +147,76 @@ class GameList(tk.Frame):
         scroll_host.pack(fill="both", expand=True)
         self._canvas = tk.Canvas(scroll_host, bg=C["surface"], highlightthickness=0, bd=0)
         canvas = self._canvas
-        scrollbar = CyberScrollbar(
+        self._scrollbar = CyberScrollbar(
             scroll_host, command=canvas.yview, width=24,
             thumb_min=40, thumb_max=520,
             bg=C["surface"], thumb_color=C["border"],
             thumb_hover=C["accent_dim"], thumb_press=C["cyan"],
         )
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
+        canvas.configure(yscrollcommand=self._on_yview)
+        self._scrollbar.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
-
-        self._row_container = tk.Frame(canvas, bg=C["surface"])
-        win_id = canvas.create_window((0, 0), window=self._row_container, anchor="nw")
-        self._row_container.bind("<Configure>", lambda _: self._sync_scrollregion())
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig(win_id, width=e.width) or self._sync_scrollregion())
-        canvas.bind_all("<MouseWheel>",
-                        lambda e: canvas.yview_scroll(-(e.delta // 120), "units"))
+        # Centred message shown over the empty list, e.g. while loading.
+        self._placeholder = tk.Label(canvas, font=FONT, bg=C["surface"],
+                                     fg=C["text_dim"])
+
+        canvas.bind("<Configure>", self._on_canvas_configure)
+        # Wheel handling is scoped to the list through a shared bindtag that
+        # the canvas and every pooled row widget carry, not bind_all.
+        self.wheel_tag = f"{self}.wheel"
+        canvas.bindtags((self.wheel_tag,) + canvas.bindtags())
+        canvas.bind_class(self.wheel_tag, "<MouseWheel>", self._on_wheel)
+        canvas.bind_class(self.wheel_tag, "<Button-4>", self._on_wheel)
+        canvas.bind_class(self.wheel_tag, "<Button-5>", self._on_wheel)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def populate(self, games: list[dict], mode: str) -> None:
-        """Rebuild the game rows for the given install mode."""
-        for child in self._row_container.winfo_children():
-            child.destroy()
-        self.check_vars.clear()
-        self._stripe_widgets.clear()
-        self._row_frames.clear()
-        self._check_all_var.set(False)
+        """Load a fresh game list and show the games of the given install mode."""
+        # Group once; mode switches then cost a single dict lookup.
+        self._games_by_type = {}
+        for g in games:
+            self._games_by_type.setdefault(g.get("type", "game"), []).append(g)
+        self._mode_state.clear()
+        self._mode = None
+        self.set_placeholder(None)
+        self.set_mode(mode)
+
+    def set_placeholder(self, text: str | None) -> None:
+        """Show *text* in place of the rows, or hide it when None."""
+        if text:
+            self._placeholder.configure(text=text)
+            self._placeholder.place(relx=0.5, rely=0.5, anchor="center")
+        else:
+            self._placeholder.place_forget()
+
+    def set_mode(self, mode: str) -> None:
+        """Switch to another install mode, keeping each mode's selections."""
+        if mode == self._mode:
+            return
+        if self._mode is not None:
+            self._mode_state[self._mode] = (
+                self.visible_games, self._checked, self._checked_count,
+                self._selected_idx, self._canvas.yview()[0])
+        self._mode = mode
+
+        saved = self._mode_state.pop(mode, None)
+        if saved is None:
+            games = self._games_by_type.get(mode, [])
+            saved = (games, bytearray(len(games)), 0, 0, 0.0)
+        self.visible_games, self._checked, self._checked_count, selected, top = saved
+        self._sync_select_all()
         self._selected_idx = -1
 
-        self.visible_games = [g for g in games if g.get("type", "game") == mode]
-        for idx, game in enumerate(self.visible_games):
-            self._add_row(idx, game)
-        if self.visible_games:
-            self.select_game(0)
-
-        self._row_container.update_idletasks()
         self._sync_scrollregion()
-        self._canvas.yview_moveto(0)
+        self._canvas.yview_moveto(top)
+        self._refresh_rows(force=True)
+        if self.visible_games:
+            self.select_game(selected)
 
     def selected_games(self) -> list[dict]:
         """Return the list of currently checked games."""
-        return [self.visible_games[i] for i, v in enumerate(self.check_vars) if v.get()]
+        return list(compress(self.visible_games, self._checked))
 
     def selected_game(self) -> dict | None:
         """Return the currently highlighted game, or None."""
@@ -85,92 +228,130 @@ class GameList(tk.Frame):
         """Highlight row *idx* and fire the on_select callback."""
         if idx == self._selected_idx:
             return
-        if 0 <= self._selected_idx < len(self._row_frames):
-            old_frame, old_bg = self._row_frames[self._selected_idx]
-            self._set_row_bg(old_frame, old_bg)
+        old = self._selected_idx
         self._selected_idx = idx
-        if 0 <= idx < len(self._row_frames):
-            new_frame, _ = self._row_frames[idx]
-            self._set_row_bg(new_frame, C["row_hover"])
+        for row in self._row_pool:
+            if row.idx in (old, idx):
+                self._paint(row)
         if self._on_select and 0 <= idx < len(self.visible_games):
             self._on_select(self.visible_games[idx])
 
-    # ── Private ───────────────────────────────────────────────────────────────
+    # ── Virtualisation ────────────────────────────────────────────────────────
+
+    def _row_height(self) -> int:
+        if not self._row_h:
+            probe = self._new_row()
+            probe.frame.update_idletasks()
+            self._row_h = max(probe.frame.winfo_reqheight(), 1)
+            self._canvas.configure(yscrollincrement=self._row_h)
+        return self._row_h
+
+    def _new_row(self) -> _RowView:
+        row = _RowView(self._canvas, self)
+        row.win_id = self._canvas.create_window(
+            0, 0, window=row.frame, anchor="nw", state="hidden")
+        self._row_pool.append(row)
+        return row
+
+    def _ensure_pool(self) -> None:
+        """Grow the pool to cover the viewport plus one row either side."""
+        row_h = self._row_height()
+        wanted = math.ceil(self._canvas.winfo_height() / row_h) + 2
+        if len(self._row_pool) < wanted:
+            while len(self._row_pool) < wanted:
+                self._new_row()
+            self._first = -1  # pool size changed: every row must be rebound
+        width = self._canvas.winfo_width()
+        for row in self._row_pool:
+            self._canvas.itemconfigure(row.win_id, width=width, height=row_h)
+
+    def _refresh_rows(self, force: bool = False) -> None:
+        """Bind pool rows to the games currently inside the viewport."""
+        if not self._row_pool:
+            return
+        row_h = self._row_height()
+        first = max(0, int(self._canvas.canvasy(0) // row_h))
+        if first == self._first and not force:
+            return
+        self._first = first
+        pool = len(self._row_pool)
+        n = len(self.visible_games)
+        shown: set[int] = set()
+        # Ring mapping: game idx lives in pool slot idx % pool, so scrolling
+        # by one row rebinds a single row view instead of all of them.
+        for idx in range(first, min(first + pool, n)):
+            row = self._row_pool[idx % pool]
+            shown.add(idx % pool)
+            # Rows already showing the right game need no Tk calls at all.
+            if force or row.idx != idx:
+                row.bind_game(idx, self.visible_games[idx], self._checked[idx])
+                self._canvas.coords(row.win_id, 0, idx * row_h)
+                self._canvas.itemconfigure(row.win_id, state="normal")
+                self._paint(row)
+        for slot, row in enumerate(self._row_pool):
+            if slot not in shown and row.idx >= 0:
+                row.idx = -1
+                self._canvas.itemconfigure(row.win_id, state="hidden")
+
+    def _on_canvas_configure(self, _event: tk.Event) -> None:
+        self._ensure_pool()
+        self._sync_scrollregion()
+        self._refresh_rows(force=self._first == -1)
+
+    def _on_yview(self, lo: str, hi: str) -> None:
+        self._scrollbar.set(lo, hi)
+        self._refresh_rows()
+
+    def _on_wheel(self, event: tk.Event) -> None:
+        # Coalesce a burst of wheel ticks into a single scroll per idle pass.
+        if event.num == 4:      # X11 wheel up
+            self._pending_scroll -= 1
+        elif event.num == 5:    # X11 wheel down
+            self._pending_scroll += 1
+        else:
+            self._pending_scroll -= event.delta // 120
+        if self._scroll_job is None:
+            self._scroll_job = self.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        self._scroll_job = None
+        steps, self._pending_scroll = self._pending_scroll, 0
+        if steps:
+            self._canvas.yview_scroll(steps, "units")
 
     def _sync_scrollregion(self) -> None:
-        bb = self._canvas.bbox("all") or (0, 0, 0, 0)
-        h = max(bb[3], self._canvas.winfo_height())
-        self._canvas.configure(scrollregion=(bb[0], bb[1], bb[2], h))
+        h = max(len(self.visible_games) * self._row_height(),
+                self._canvas.winfo_height())
+        self._canvas.configure(
+            scrollregion=(0, 0, self._canvas.winfo_width(), h))
+
+    # ── Row state ─────────────────────────────────────────────────────────────
+
+    def _paint(self, row: _RowView) -> None:
+        if row.idx < 0:
+            return
+        row.paint(row.idx == self._selected_idx, self._checked[row.idx])
 
     def _toggle_all(self) -> None:
         state = self._check_all_var.get()
-        for v, s in zip(self.check_vars, self._stripe_widgets):
-            v.set(state)
-            s.configure(bg=C["cyan"] if state else C["border"])
+        self._checked = bytearray([state]) * len(self.visible_games)
+        self._checked_count = len(self._checked) if state else 0
+        # Only the stripes depend on the checked state; leave backgrounds alone.
+        color = _CYAN if state else _BORDER
+        hover_color = _CYAN if state else _MAGENTA
+        for row in self._row_pool:
+            if row.idx >= 0:
+                row.var.set(state)
+                row.set_stripe(hover_color if row.hover else color)
 
     def _sync_select_all(self) -> None:
-        self._check_all_var.set(
-            all(v.get() for v in self.check_vars) if self.check_vars else False)
-
-    @staticmethod
-    def _set_row_bg(frame: tk.Frame, bg: str) -> None:
-        frame.configure(bg=bg)
-        for child in frame.winfo_children():
-            try:
-                child.configure(bg=bg)
-            except tk.TclError:
-                pass
-
-    def _add_row(self, idx: int, game: dict) -> None:
-        row_bg = C["row_even"] if idx % 2 == 0 else C["row_odd"]
-
-        frame = tk.Frame(self._row_container, bg=row_bg, pady=6, cursor="hand2")
-        frame.pack(fill="x")
-
-        stripe = tk.Frame(frame, bg=C["border"], width=4)
-        stripe.pack(side="left", fill="y")
-
-        var = tk.BooleanVar(value=False)
-        self.check_vars.append(var)
-        self._stripe_widgets.append(stripe)
-        self._row_frames.append((frame, row_bg))
-
-        def _update_stripe(v=var, s=stripe):
-            s.configure(bg=C["cyan"] if v.get() else C["border"])
-            self._sync_select_all()
-
-        cb = tk.Checkbutton(
-            frame, variable=var, command=_update_stripe,
-            bg=row_bg, fg=C["cyan"],
-            selectcolor=C["cb_select"], activebackground=row_bg,
-            activeforeground=C["cyan"], bd=0, relief="flat",
-        )
-        cb.pack(side="left", padx=(6, 0))
-
-        tk.Label(frame, text=f"{idx + 1:02d}", font=FONT,
-                 bg=row_bg, fg=C["text_dim"], width=3, anchor="e").pack(side="left")
-
-        name_lbl = tk.Label(frame, text=game["name"], font=FONT,
-                            fg=C["text"], bg=row_bg, anchor="w")
-        name_lbl.pack(side="left", padx=(8, 0), fill="x", expand=True)
-
-        # Row interaction helpers
-        def _select(_e, i=idx):
-            self.select_game(i)
-
-        def _enter(_e, r=frame, s=stripe, v=var, i=idx):
-            if self._selected_idx != i:
-                self._set_row_bg(r, C["row_hover"])
-            s.configure(bg=C["cyan"] if v.get() else C["magenta"])
-
-        def _leave(_e, r=frame, s=stripe, v=var, bg=row_bg, i=idx):
-            sel_bg = C["row_hover"] if self._selected_idx == i else bg
-            self._set_row_bg(r, sel_bg)
-            s.configure(bg=C["cyan"] if v.get() else C["border"])
-
-        for w in (frame, name_lbl):
-            w.bind("<Button-1>", _select)
-            w.bind("<Enter>", _enter)
-            w.bind("<Leave>", _leave)
-        cb.bind("<Enter>", _enter)
-        cb.bind("<Leave>", _leave)
+        # O(1): the running count replaces a Tcl round-trip per row.
+        n = len(self._checked)
+        self._check_all_var.set(n > 0 and self._checked_count == n)
+
+    def _row_toggled(self, row: _RowView) -> None:
+        checked = row.var.get()
+        self._checked[row.idx] = checked
+        self._checked_count += 1 if checked else -1
+        self._paint(row)
+        self._sync_select_all()
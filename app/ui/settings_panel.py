@@ -127,13 +127,12 @@ class SettingsPanel(tk.Frame):
 
     def _refresh_from_settings(self) -> None:
         self._refreshing = True
-        for key, val in [
-            ("disable_game_sync", settings.disable_game_sync),
-            ("disable_downloads", settings.disable_downloads),
-            ("download_only",     settings.download_only),
-            ("games_filter",      settings.games_filter or ""),
-            ("download_url",      settings.download_url or ""),
-        ]:
+        for key, val in settings.as_dict().items():
+            if val is None:
+                val = ""
+            # Only touch variables whose value differs from the stored one.
+            if self._vars[key].get() == val:
+                continue
             self._vars[key].set(val)
             if key in self._toggle_switches:
                 self._toggle_switches[key].snap(bool(val))
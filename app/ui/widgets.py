@@ -50,8 +50,11 @@ class CyberScrollbar(tk.Canvas):
         self._drag_start_y: int | None = None
         self._drag_start_lo = 0.0
         self._thumb_id: int | None = None
+        # Size from the last <Configure>, so redraws make no winfo_* queries.
+        self._cur_w = width
+        self._cur_h = 0
 
-        self.bind("<Configure>", lambda _: self._redraw())
+        self.bind("<Configure>", self._on_configure)
         self.bind("<Button-1>", self._on_press)
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
@@ -63,9 +66,13 @@ class CyberScrollbar(tk.Canvas):
         self._lo, self._hi = float(lo), float(hi)
         self._redraw()
 
+    def _on_configure(self, event: tk.Event) -> None:
+        self._cur_w, self._cur_h = event.width, event.height
+        self._redraw()
+
     def _thumb_coords(self) -> tuple[int, int, int, int]:
-        h = self.winfo_height()
-        w = self.winfo_width()
+        h = self._cur_h
+        w = self._cur_w
         if h < 1:
             return 0, 0, w, 0
         visible = self._hi - self._lo
@@ -105,7 +112,7 @@ class CyberScrollbar(tk.Canvas):
             self._current_color = self._thumb_press
             self._redraw()
         else:
-            h = self.winfo_height()
+            h = self._cur_h
             frac = event.y / h
             visible = self._hi - self._lo
             new_lo = max(0.0, min(1.0 - visible, frac - visible / 2))
@@ -115,7 +122,7 @@ class CyberScrollbar(tk.Canvas):
     def _on_drag(self, event: tk.Event) -> None:
         if self._drag_start_y is None:
             return
-        h = self.winfo_height()
+        h = self._cur_h
         visible = self._hi - self._lo
         _, y1, _, y2 = self._thumb_coords()
         thumb_h = y2 - y1
@@ -149,14 +156,16 @@ class CyberScrollbar(tk.Canvas):
 class CyberButton(tk.Button):
     """Styled button that brightens on hover."""
 
+    # Theme lookups resolved once, not per instance.
+    _DEFAULTS = dict(
+        bg=C["btn_bg"], fg=C["btn_fg"],
+        activebackground=C["btn_hov"], activeforeground=C["btn_fg"],
+        font=FONT_BOLD, relief="flat", cursor="hand2",
+        padx=16, pady=12, bd=0,
+    )
+
     def __init__(self, parent: tk.Widget, **kw):
-        defaults = dict(
-            bg=C["btn_bg"], fg=C["btn_fg"],
-            activebackground=C["btn_hov"], activeforeground=C["btn_fg"],
-            font=FONT_BOLD, relief="flat", cursor="hand2",
-            padx=16, pady=12, bd=0,
-        )
-        defaults.update(kw)
+        defaults = {**self._DEFAULTS, **kw}
         super().__init__(parent, **defaults)
         self._bg  = defaults["bg"]
         self._hov = defaults["activebackground"]
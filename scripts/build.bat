@@ -19,6 +19,7 @@ pyinstaller ^
     --collect-submodules app.core ^
     --collect-submodules app.ui ^
     --collect-all numpy ^
+    --hidden-import yaml._yaml ^
     app/lan_game_installer.py
 
 echo.
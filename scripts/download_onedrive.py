@@ -3,6 +3,9 @@ from __future__ import annotations
 import argparse
 import asyncio
 import base64
+import json
+import mmap
+import os
 import numpy as np
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +20,7 @@ DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:1
 TIMEOUTS = ClientTimeout(total=60, connect=30)
 DOWNLOAD_FOLDER = Path("OneDrive_Downloads")
 BADGER_URL = URL("https://api-badgerp.svc.ms/v1.0/token")
+HASH_CACHE_FILE = DOWNLOAD_FOLDER / ".quickxorhash_cache.json"
 
 # Default app details used in browsers by unautenticated sessions
 APP_ID = "1141147648"
@@ -33,6 +37,10 @@ _qxh_high_shift = (8 - _qxh_bit_off) % 8
 _qxh_has_high = _qxh_bit_off > 0
 _QXH_BLOCK_SIZE = (64 * 1024 * 1024 // _QXH_CYCLE) * _QXH_CYCLE  # 67,108,800 bytes
 
+# Local file hashes from earlier runs: path -> [size, mtime_ns, digest]
+_hash_cache: dict[str, list] = {}
+_hash_cache_dirty = False
+
 
 @dataclass(frozen=True, slots=True)
 class AccessDetails:
@@ -57,6 +65,7 @@ class AccessDetails:
 
 
 async def process_url(url: URL) -> None:
+    _load_hash_cache()
     try:
         async with ClientSession(
             headers=DEFAULT_HEADERS,
@@ -74,6 +83,8 @@ async def process_url(url: URL) -> None:
     except Exception as e:
         msg = f"Download Failed: {e}"
         print(msg)
+    finally:
+        _save_hash_cache()
 
 
 async def download(client_session: ClientSession, url: URL) -> None:
@@ -143,20 +154,33 @@ async def download_file(
     expected_size: int | None = None,
     expected_hash: str | None = None,
 ) -> None:
-    if output.exists() and expected_size is not None and expected_hash is not None:
-        if output.stat().st_size != expected_size:
-            print(f"  Size mismatch ({output.stat().st_size} != {expected_size}), re-downloading: {output.name}")
+    global _hash_cache_dirty
+    # Collect this file's status lines and write them in one go: console
+    # writes are slow on Windows and are otherwise one per line.
+    log: list[str] = []
+    st = _stat_or_none(output)
+    if st is not None and expected_size is not None and expected_hash is not None:
+        if st.st_size != expected_size:
+            log.append(f"  Size mismatch ({st.st_size} != {expected_size}), re-downloading: {output.name}")
         else:
-            loop = asyncio.get_running_loop()
-            local_hash = await loop.run_in_executor(None, quickxorhash_file, output)
-            print(f"  Local hash: {local_hash}")
-            print(f"  Expected hash: {expected_hash}")
+            hit = _hash_cache.get(str(output))
+            if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+                local_hash = hit[2]
+            else:
+                loop = asyncio.get_running_loop()
+                local_hash = await loop.run_in_executor(None, quickxorhash_file, output)
+                _hash_cache[str(output)] = [st.st_size, st.st_mtime_ns, local_hash]
+                _hash_cache_dirty = True
+            log.append(f"  Local hash: {local_hash}")
+            log.append(f"  Expected hash: {expected_hash}")
             if local_hash == expected_hash:
-                print(f"  Skipping (up to date): {output}")
+                log.append(f"  Skipping (up to date): {output}")
+                print("\n".join(log))
                 return
-            print(f"  Hash mismatch, re-downloading: {output.name}")
+            log.append(f"  Hash mismatch, re-downloading: {output.name}")
 
-    print(f"Downloading: {output}")
+    log.append(f"Downloading: {output}")
+    print("\n".join(log))
     async with client_session.get(url, raise_for_status=True) as response:
         total_size = int(response.headers.get("Content-Length", 0))
         output.parent.mkdir(parents=True, exist_ok=True)
@@ -185,20 +209,48 @@ def create_api_url(access_details: AccessDetails) -> URL:
 def is_share_link(url: URL) -> bool:
     return url.host == SHARE_LINK_HOST and any(p in url.parts for p in ("f", "t", "u"))
 
-def quickxorhash_file(path: Path) -> str:
-    xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
-    total_length = 0
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
 
+def _load_hash_cache() -> None:
+    global _hash_cache_dirty
+    try:
+        with HASH_CACHE_FILE.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(data, dict):
+        # Drop entries in the old "path:size:mtime_ns" -> digest format
+        entries = {k: v for k, v in data.items() if isinstance(v, list) and len(v) == 3}
+        _hash_cache_dirty = len(entries) != len(data)
+        _hash_cache.update(entries)
+
+def _save_hash_cache() -> None:
+    global _hash_cache_dirty
+    if not _hash_cache_dirty:
+        return
+    try:
+        HASH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HASH_CACHE_FILE.with_name(HASH_CACHE_FILE.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(_hash_cache, f)
+        os.replace(tmp, HASH_CACHE_FILE)
+    except OSError:
+        return
+    _hash_cache_dirty = False
+
+def quickxorhash_file(path: Path) -> str:
     with open(path, "rb") as fh:
-        while chunk := fh.read(_QXH_BLOCK_SIZE):
-            data = np.frombuffer(chunk, dtype=np.uint8)
-            total_length += len(data)
-            remainder = len(data) % _QXH_CYCLE
-            if remainder:
-                padded = np.zeros(len(data) + (_QXH_CYCLE - remainder), dtype=np.uint8)
-                padded[: len(data)] = data
-                data = padded
-            xor_accum ^= np.bitwise_xor.reduce(data.reshape(-1, _QXH_CYCLE), axis=0)
+        total_length = os.fstat(fh.fileno()).st_size
+        if total_length:
+            # Fold the mapped file in place instead of copying it out in read() chunks
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                xor_accum = _qxh_fold(mm, total_length)
+        else:
+            xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
 
     # Apply the rotation schedule to produce the 20-byte state
     state = np.zeros(20, dtype=np.uint8)
@@ -215,6 +267,19 @@ def quickxorhash_file(path: Path) -> str:
     return base64.b64encode(bytes(state)).decode()
 
 
+def _qxh_fold(buf: mmap.mmap, size: int) -> np.ndarray:
+    xor_accum = np.zeros(_QXH_CYCLE, dtype=np.uint8)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    full = size - size % _QXH_CYCLE
+    for off in range(0, full, _QXH_BLOCK_SIZE):
+        block = data[off:min(off + _QXH_BLOCK_SIZE, full)]
+        xor_accum ^= np.bitwise_xor.reduce(block.reshape(-1, _QXH_CYCLE), axis=0)
+    # The trailing partial row is XORed as if zero-padded to a full cycle
+    if full < size:
+        xor_accum[: size - full] ^= data[full:]
+    return xor_accum
+
+
 def main() -> None:
     try:
         parser = argparse.ArgumentParser()